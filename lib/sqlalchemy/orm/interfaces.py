@@ -213,6 +213,8 @@ class MapperProperty(
         """
 
     def __init__(self):
+        # NOTE: ColumnProperty._init_options sets these directly rather
+        # than calling up to here; keep the two in sync
         self._configure_started = False
         self._configure_finished = False
 
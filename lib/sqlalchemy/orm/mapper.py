@@ -2240,11 +2240,18 @@ class Mapper(
                     "parententity": self,
                     "parentmapper": self,
                 }
-            )._set_propagate_attrs(
-                {"compile_state_plugin": "orm", "plugin_subject": self}
-            )
+            )._set_propagate_attrs(self._orm_propagate_attrs)
 
         return self.selectable._annotate(annotations)._set_propagate_attrs(
+            self._orm_propagate_attrs
+        )
+
+    @util.memoized_property
+    def _orm_propagate_attrs(self):
+        """The propagate_attrs applied to ORM-annotated elements that
+        refer to this mapper."""
+
+        return util.immutabledict(
             {"compile_state_plugin": "orm", "plugin_subject": self}
         )
 
@@ -2260,9 +2267,7 @@ class Mapper(
                     "identity_token": True,
                 }
             )
-            ._set_propagate_attrs(
-                {"compile_state_plugin": "orm", "plugin_subject": self}
-            )
+            ._set_propagate_attrs(self._orm_propagate_attrs)
         )
 
     @property
@@ -35,6 +35,28 @@ __all__ = [
     "SynonymProperty",
 ]
 
+_COLUMN_PROP_KWARGS = frozenset(
+    [
+        "group",
+        "deferred",
+        "raiseload",
+        "_instrument",
+        "comparator_factory",
+        "descriptor",
+        "active_history",
+        "expire_on_flush",
+        "info",
+        "doc",
+    ]
+)
+
+_MISSING = util.symbol("MISSING")
+
+# strategy keys for the most common flag combinations, shared among all
+# ColumnProperty objects rather than being rebuilt for each one
+_DEFAULT_STRATEGY_KEY = (("deferred", False), ("instrument", True))
+_DEFERRED_STRATEGY_KEY = (("deferred", True), ("instrument", True))
+
 
 @log.class_logger
 class ColumnProperty(StrategizedProperty):
@@ -152,34 +174,71 @@ class ColumnProperty(StrategizedProperty):
             expressions
 
         """
-        super(ColumnProperty, self).__init__()
-        self._orig_columns = [
-            coercions.expect(roles.LabeledColumnExprRole, c) for c in columns
-        ]
-        self.columns = [
-            coercions.expect(
-                roles.LabeledColumnExprRole, _orm_full_deannotate(c)
+        unexpected = set(kwargs).difference(_COLUMN_PROP_KWARGS)
+        if unexpected:
+            raise TypeError(
+                "%s received unexpected keyword argument(s): %s"
+                % (self.__class__.__name__, ", ".join(sorted(unexpected)))
             )
-            for c in columns
-        ]
-        self.group = kwargs.pop("group", None)
-        self.deferred = kwargs.pop("deferred", False)
-        self.raiseload = kwargs.pop("raiseload", False)
-        self.instrument = kwargs.pop("_instrument", True)
-        self.comparator_factory = kwargs.pop(
+
+        expect = coercions.expect
+        role = roles.LabeledColumnExprRole
+        self._orig_columns = orig_columns = []
+        self.columns = cols = []
+        for c in columns:
+            orig = expect(role, c)
+            orig_columns.append(orig)
+            deannotated = _orm_full_deannotate(c)
+            if deannotated is c:
+                # nothing was deannotated; coercion would produce the
+                # same result again
+                cols.append(orig)
+            else:
+                cols.append(expect(role, deannotated))
+
+        self._init_options(kwargs)
+
+    @classmethod
+    def _construct_precoerced(cls, columns, orig_columns, **kwargs):
+        """Construct a :class:`.ColumnProperty` from columns that were
+        already coerced by another :class:`.ColumnProperty`, skipping
+        coercion.
+
+        """
+        self = cls.__new__(cls)
+        self._orig_columns = list(orig_columns)
+        self.columns = list(columns)
+        self._init_options(kwargs)
+        return self
+
+    def _init_options(self, kwargs):
+        # NOTE: mirrors MapperProperty.__init__; StrategizedProperty
+        # doesn't define its own
+        self._configure_started = False
+        self._configure_finished = False
+
+        get = kwargs.get
+        self.group = get("group", None)
+        self.deferred = get("deferred", False)
+        self.raiseload = get("raiseload", False)
+        self.instrument = get("_instrument", True)
+        self.comparator_factory = get(
             "comparator_factory", self.__class__.Comparator
         )
-        self.descriptor = kwargs.pop("descriptor", None)
-        self.active_history = kwargs.pop("active_history", False)
-        self.expire_on_flush = kwargs.pop("expire_on_flush", True)
+        self.descriptor = get("descriptor", None)
+        self.active_history = get("active_history", False)
+        self.expire_on_flush = get("expire_on_flush", True)
 
         if "info" in kwargs:
-            self.info = kwargs.pop("info")
+            self.info = kwargs["info"]
 
+        columns = self.columns
         if "doc" in kwargs:
-            self.doc = kwargs.pop("doc")
+            self.doc = kwargs["doc"]
+        elif len(columns) == 1:
+            self.doc = getattr(columns[0], "doc", None)
         else:
-            for col in reversed(self.columns):
+            for col in reversed(columns):
                 doc = getattr(col, "doc", None)
                 if doc is not None:
                     self.doc = doc
@@ -187,20 +246,21 @@ class ColumnProperty(StrategizedProperty):
             else:
                 self.doc = None
 
-        if kwargs:
-            raise TypeError(
-                "%s received unexpected keyword argument(s): %s"
-                % (self.__class__.__name__, ", ".join(sorted(kwargs.keys())))
-            )
-
         util.set_creation_order(self)
 
-        self.strategy_key = (
-            ("deferred", self.deferred),
-            ("instrument", self.instrument),
-        )
+        deferred, instrument = self.deferred, self.instrument
+        if deferred is False and instrument is True:
+            strategy_key = _DEFAULT_STRATEGY_KEY
+        elif deferred is True and instrument is True:
+            strategy_key = _DEFERRED_STRATEGY_KEY
+        else:
+            strategy_key = (
+                ("deferred", deferred),
+                ("instrument", instrument),
+            )
         if self.raiseload:
-            self.strategy_key += (("raiseload", True),)
+            strategy_key += (("raiseload", True),)
+        self.strategy_key = strategy_key
 
     @util.preload_module("sqlalchemy.orm.state", "sqlalchemy.orm.strategies")
     def _memoized_attr__deferred_column_loader(self):
@@ -280,17 +340,21 @@ class ColumnProperty(StrategizedProperty):
             )
 
     def copy(self):
-        return ColumnProperty(
+        # the columns are already coerced; deannotating them still deep
+        # copies expression columns so that the copy doesn't share them
+        # with this property, same as the public constructor does
+        return ColumnProperty._construct_precoerced(
+            [_orm_full_deannotate(c) for c in self.columns],
+            self.columns,
             deferred=self.deferred,
             group=self.group,
             active_history=self.active_history,
-            *self.columns
         )
 
     def _getcommitted(
         self, state, dict_, column, passive=attributes.PASSIVE_OFF
     ):
-        return state.get_impl(self.key).get_committed_value(
+        return state.manager[self.key].impl.get_committed_value(
             state, dict_, passive=passive
         )
 
@@ -307,18 +371,17 @@ class ColumnProperty(StrategizedProperty):
     ):
         if not self.instrument:
             return
-        elif self.key in source_dict:
-            value = source_dict[self.key]
 
+        key = self.key
+        value = source_dict.get(key, _MISSING)
+        if value is not _MISSING:
             if not load:
-                dest_dict[self.key] = value
+                dest_dict[key] = value
             else:
-                impl = dest_state.get_impl(self.key)
+                impl = dest_state.get_impl(key)
                 impl.set(dest_state, dest_dict, value, None)
-        elif dest_state.has_identity and self.key not in dest_dict:
-            dest_state._expire_attributes(
-                dest_dict, [self.key], no_loader=True
-            )
+        elif dest_state.has_identity and key not in dest_dict:
+            dest_state._expire_attributes(dest_dict, [key], no_loader=True)
 
     class Comparator(util.MemoizedSlots, PropComparator):
         """Produce boolean, comparison, and other operators for
@@ -339,7 +402,23 @@ class ColumnProperty(StrategizedProperty):
 
         """
 
-        __slots__ = "__clause_element__", "info", "expressions"
+        __slots__ = (
+            "__clause_element__",
+            "info",
+            "expressions",
+            "_orm_annotations",
+        )
+
+        def _memoized_attr__orm_annotations(self):
+            pe = self._parententity
+            return util.immutabledict(
+                {
+                    "entity_namespace": pe,
+                    "parententity": pe,
+                    "parentmapper": pe,
+                    "orm_key": self.prop.key,
+                }
+            )
 
         def _orm_annotate_column(self, column):
             """annotate and possibly adapt a column to be returned
@@ -355,12 +434,7 @@ class ColumnProperty(StrategizedProperty):
             """
 
             pe = self._parententity
-            annotations = {
-                "entity_namespace": pe,
-                "parententity": pe,
-                "parentmapper": pe,
-                "orm_key": self.prop.key,
-            }
+            annotations = self._orm_annotations
 
             col = column
 
@@ -368,17 +442,24 @@ class ColumnProperty(StrategizedProperty):
             # the column against the polymorphic selectable.
             # see also orm.util._orm_downgrade_polymorphic_columns
             # for the reverse operation.
-            if self._parentmapper._polymorphic_adapter:
+            polymorphic_adapter = self._parentmapper._polymorphic_adapter
+            if polymorphic_adapter:
                 mapper_local_col = col
-                col = self._parentmapper._polymorphic_adapter.traverse(col)
+
+                # ColumnAdapter memoizes adapted columns in its
+                # .columns collection, so this is a dictionary lookup
+                # after the first call for a given column.
+                col = polymorphic_adapter.traverse(col)
 
                 # this is a clue to the ORM Query etc. that this column
                 # was adapted to the mapper's polymorphic_adapter.  the
                 # ORM uses this hint to know which column its adapting.
-                annotations["adapt_column"] = mapper_local_col
+                annotations = annotations.union(
+                    {"adapt_column": mapper_local_col}
+                )
 
             return col._annotate(annotations)._set_propagate_attrs(
-                {"compile_state_plugin": "orm", "plugin_subject": pe}
+                pe._orm_propagate_attrs
             )
 
         def _memoized_method___clause_element__(self):
@@ -403,15 +484,27 @@ class ColumnProperty(StrategizedProperty):
             .. versionadded:: 1.3.17
 
             """
-            if self.adapter:
-                return [
-                    self.adapter(col, self.prop.key)
-                    for col in self.prop.columns
-                ]
+            columns = self.prop.columns
+            if (
+                type(self).__clause_element__
+                is ColumnProperty.Comparator.__clause_element__
+            ):
+                # the first column is the one __clause_element__()
+                # already adapts / annotates; reuse it
+                expressions = [self.__clause_element__()]
+                columns = columns[1:]
+            else:
+                expressions = []
+
+            adapter = self.adapter
+            if adapter:
+                key = self.prop.key
+                expressions.extend(adapter(col, key) for col in columns)
             else:
-                return [
-                    self._orm_annotate_column(col) for col in self.prop.columns
-                ]
+                expressions.extend(
+                    self._orm_annotate_column(col) for col in columns
+                )
+            return expressions
 
         def _fallback_getattr(self, key):
             """proxy attribute access down to the mapped column.
@@ -709,7 +709,14 @@ class AliasedInsp(
                 "entity_namespace": self,
                 "compile_state_plugin": "orm",
             }
-        )._set_propagate_attrs(
+        )._set_propagate_attrs(self._orm_propagate_attrs)
+
+    @util.memoized_property
+    def _orm_propagate_attrs(self):
+        """The propagate_attrs applied to ORM-annotated elements that
+        refer to this :class:`.AliasedInsp`."""
+
+        return util.immutabledict(
             {"compile_state_plugin": "orm", "plugin_subject": self}
         )
 
@@ -775,9 +782,7 @@ class AliasedInsp(
         return (
             self._adapter.traverse(elem)
             ._annotate(d)
-            ._set_propagate_attrs(
-                {"compile_state_plugin": "orm", "plugin_subject": self}
-            )
+            ._set_propagate_attrs(self._orm_propagate_attrs)
         )
 
     def _entity_for_mapper(self, mapper):
@@ -232,7 +232,12 @@ class ClauseElement(
 
         # assert not self._propagate_attrs
 
-        self._propagate_attrs = util.immutabledict(values)
+        if isinstance(values, util.immutabledict):
+            # already immutable; callers such as the ORM pass in one
+            # shared dictionary per entity
+            self._propagate_attrs = values
+        else:
+            self._propagate_attrs = util.immutabledict(values)
         return self
 
     def _clone(self):
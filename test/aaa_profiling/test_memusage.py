@@ -339,6 +339,52 @@ class MemUsageTest(EnsureZeroed):
 
         go()
 
+    @testing.combinations((True,), (False,), argnames="polymorphic")
+    def test_discarded_inheriting_mappers(self, polymorphic):
+        """test that column comparators on a discarded inheriting
+        mapper don't keep it referenced from the base mapper's
+        ColumnProperty objects."""
+
+        metadata = MetaData()
+        base_table = Table(
+            "base",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("x", Integer),
+        )
+
+        class Base(object):
+            pass
+
+        mapper(Base, base_table)
+
+        mapper_refs = []
+        for i in range(5):
+            sub = type("Sub%d" % i, (Base,), {})
+            if polymorphic:
+                sub_table = Table(
+                    "sub%d" % i,
+                    metadata,
+                    Column(
+                        "id",
+                        Integer,
+                        ForeignKey("base.id"),
+                        primary_key=True,
+                    ),
+                )
+                m = mapper(sub, sub_table, inherits=Base, with_polymorphic="*")
+            else:
+                m = mapper(sub, inherits=Base)
+            mapper_refs.append(weakref.ref(m))
+
+            str(select(sub.x).where(sub.x == 5))
+            str(select(sub.id).where(sub.id == 5))
+
+            del sub, m
+
+        gc_collect()
+        eq_([ref for ref in mapper_refs if ref() is not None], [])
+
 
 class MemUsageWBackendTest(EnsureZeroed):
 
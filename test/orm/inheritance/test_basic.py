@@ -175,6 +175,54 @@ class ColExpressionsTest(fixtures.DeclarativeMappedTest):
         eq_(rows, [(1, 1, 5), (2, 2, 7)])
 
 
+class PolymorphicAdaptColumnAnnotationTest(fixtures.DeclarativeMappedTest):
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class A(Base):
+            __tablename__ = "a"
+            id = Column(Integer, primary_key=True)
+            type = Column(String(10))
+            __mapper_args__ = {
+                "polymorphic_on": type,
+                "polymorphic_identity": "a",
+                "with_polymorphic": "*",
+            }
+
+        class B(A):
+            __tablename__ = "b"
+            id = Column(ForeignKey("a.id"), primary_key=True)
+            data = Column(Integer)
+            __mapper_args__ = {
+                "polymorphic_identity": "b",
+                "with_polymorphic": "*",
+            }
+
+    def test_adapt_column_annotation(self):
+        A, B = self.classes("A", "B")
+        a_table, b_table = A.__table__, B.__table__
+        a_mapper, b_mapper = inspect(A), inspect(B)
+
+        # the mapper's polymorphic adapter adapts each column and notes
+        # the original column as "adapt_column"; B shares A's
+        # ColumnProperty objects for the inherited columns
+        for attr, entity, mapper_local_cols in [
+            (A.id, a_mapper, [a_table.c.id]),
+            (A.type, a_mapper, [a_table.c.type]),
+            (B.id, b_mapper, [b_table.c.id, a_table.c.id]),
+            (B.type, b_mapper, [a_table.c.type]),
+            (B.data, b_mapper, [b_table.c.data]),
+        ]:
+            expressions = attr.expressions
+            eq_(len(expressions), len(mapper_local_cols))
+            is_(expressions[0], attr.comparator.__clause_element__())
+            for expr, mapper_local_col in zip(expressions, mapper_local_cols):
+                is_(expr._annotations["adapt_column"], mapper_local_col)
+                is_(expr._annotations["parententity"], entity)
+                eq_(expr._annotations["orm_key"], attr.key)
+
+
 class PolyExpressionEagerLoad(fixtures.DeclarativeMappedTest):
     run_setup_mappers = "once"
     __dialect__ = "default"
@@ -2367,6 +2415,57 @@ class OverrideColKeyTest(fixtures.MappedTest):
             go,
         )
 
+    def test_combine_copies_base_prop(self):
+        class Base(object):
+            pass
+
+        class Sub(Base):
+            pass
+
+        mapper(Base, base)
+        mapper(Sub, subtable, inherits=Base)
+
+        base_prop = class_mapper(Base).get_property("base_id")
+        sub_prop = class_mapper(Sub).get_property("base_id")
+
+        # the subclass gets its own copy of the inherited property;
+        # plain columns are shared with the base property as is
+        assert sub_prop is not base_prop
+        eq_(base_prop.columns, [base.c.base_id])
+        is_(sub_prop.columns[0], subtable.c.base_id)
+        is_(sub_prop.columns[1], base.c.base_id)
+
+    def test_combine_copies_base_expression(self):
+        class Base(object):
+            pass
+
+        class Sub(Base):
+            pass
+
+        mapper(
+            Base,
+            base,
+            properties={"subdata": column_property(base.c.data + "x")},
+        )
+        base_prop = class_mapper(Base).get_property("subdata")
+        base_expr = base_prop.columns[0]
+
+        with testing.expect_warnings(
+            "Implicitly combining column .* with column subtable.subdata"
+        ):
+            mapper(Sub, subtable, inherits=Base)
+
+        sub_prop = class_mapper(Sub).get_property("subdata")
+
+        # expression columns are copied, not shared with the base
+        # property, same as when constructing a new column_property()
+        assert sub_prop is not base_prop
+        eq_(len(base_prop.columns), 1)
+        is_(base_prop.columns[0], base_expr)
+        is_(sub_prop.columns[0], subtable.c.subdata)
+        assert sub_prop.columns[1] is not base_expr
+        assert sub_prop.columns[1].compare(base_expr)
+
     def test_plain_descriptor(self):
         """test that descriptors prevent inheritance from propagating
         properties to subclasses."""
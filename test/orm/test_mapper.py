@@ -4,6 +4,7 @@ import logging.handlers
 import sqlalchemy as sa
 from sqlalchemy import ForeignKey
 from sqlalchemy import func
+from sqlalchemy import inspect
 from sqlalchemy import Integer
 from sqlalchemy import MetaData
 from sqlalchemy import select
@@ -853,6 +854,75 @@ class MapperTest(_fixtures.FixtureTest, AssertsCompiledSQL):
         )
         assert User.y.property.columns[0].element._raw_columns[1] is users.c.id
 
+    def test_column_prop_unexpected_kwargs(self):
+        users = self.tables.users
+
+        assert_raises_message(
+            TypeError,
+            r"ColumnProperty received unexpected keyword argument\(s\): "
+            "bar, foo",
+            column_property,
+            users.c.name,
+            foo=True,
+            bar=False,
+            deferred=True,
+        )
+
+    def test_column_prop_copy(self):
+        users = self.tables.users
+
+        expr = users.c.name + "x"
+        prop = column_property(
+            users.c.id, expr, deferred=True, group="g", active_history=True
+        )
+        prop_copy = prop.copy()
+
+        assert prop_copy is not prop
+        assert prop_copy.columns is not prop.columns
+        is_(prop_copy.columns[0], users.c.id)
+        assert prop_copy.columns[1] is not prop.columns[1]
+        assert prop_copy.columns[1].compare(prop.columns[1])
+        is_(prop_copy._orig_columns[0], prop.columns[0])
+        is_(prop_copy._orig_columns[1], prop.columns[1])
+
+        eq_(prop_copy.deferred, True)
+        eq_(prop_copy.group, "g")
+        eq_(prop_copy.active_history, True)
+        eq_(prop_copy.strategy_key, prop.strategy_key)
+
+    @testing.combinations(
+        ({}, (("deferred", False), ("instrument", True))),
+        ({"deferred": True}, (("deferred", True), ("instrument", True))),
+        (
+            {"deferred": True, "raiseload": True},
+            (("deferred", True), ("instrument", True), ("raiseload", True)),
+        ),
+        (
+            {"raiseload": True},
+            (("deferred", False), ("instrument", True), ("raiseload", True)),
+        ),
+        ({"_instrument": False}, (("deferred", False), ("instrument", False))),
+        (
+            {"deferred": True, "_instrument": False},
+            (("deferred", True), ("instrument", False)),
+        ),
+        ({"deferred": 1}, (("deferred", 1), ("instrument", True))),
+        ({"deferred": None}, (("deferred", None), ("instrument", True))),
+        (
+            {"deferred": 0, "raiseload": 1},
+            (("deferred", 0), ("instrument", True), ("raiseload", True)),
+        ),
+        argnames="kw, expected",
+    )
+    def test_column_prop_strategy_key(self, kw, expected):
+        users = self.tables.users
+
+        prop = column_property(users.c.name, **kw)
+        eq_(prop.strategy_key, expected)
+
+        # must be usable as a key for the loader strategy lookup
+        eq_(hash(prop.strategy_key), hash(expected))
+
     def test_synonym_replaces_backref(self):
         addresses, users, User = (
             self.tables.addresses,
@@ -2709,6 +2779,100 @@ class ComparatorFactoryTest(_fixtures.FixtureTest, AssertsCompiledSQL):
             dialect=default.DefaultDialect(),
         )
 
+    def test_column_custom_init(self):
+        User, users = self.classes.User, self.tables.users
+
+        from sqlalchemy.orm.interfaces import PropComparator
+        from sqlalchemy.orm.properties import ColumnProperty
+
+        class MyFactory(ColumnProperty.Comparator):
+            def __init__(self, prop, parentmapper, adapt_to_entity=None):
+                # bypasses ColumnProperty.Comparator.__init__
+                PropComparator.__init__(
+                    self, prop, parentmapper, adapt_to_entity
+                )
+
+        self.mapper(
+            User,
+            users,
+            properties={
+                "name": column_property(
+                    users.c.name, comparator_factory=MyFactory
+                )
+            },
+        )
+        self.assert_compile(
+            User.name == "ed",
+            "users.name = :name_1",
+            dialect=default.DefaultDialect(),
+        )
+        eq_(User.name.info, {})
+        eq_([str(expr) for expr in User.name.expressions], ["users.name"])
+        self.assert_compile(
+            aliased(User).name == "ed",
+            "users_1.name = :name_1",
+            dialect=default.DefaultDialect(),
+        )
+
+    def test_column_propagate_attrs(self):
+        User, users = self.classes.User, self.tables.users
+
+        from sqlalchemy.orm.properties import ColumnProperty
+
+        m = self.mapper(User, users)
+        ua = aliased(User)
+        ua_insp = inspect(ua)
+
+        is_(
+            User.name.comparator.__clause_element__()._propagate_attrs,
+            m._orm_propagate_attrs,
+        )
+        is_(
+            ua.name.comparator.__clause_element__()._propagate_attrs,
+            ua_insp._orm_propagate_attrs,
+        )
+
+        # a comparator adapted to an AliasedInsp can still produce
+        # ORM-annotated columns
+        comparator = ColumnProperty.Comparator(User.name.property, m, ua_insp)
+        expr = comparator._orm_annotate_column(users.c.name)
+        is_(expr._annotations["parententity"], ua_insp)
+        eq_(
+            expr._propagate_attrs,
+            {"compile_state_plugin": "orm", "plugin_subject": ua_insp},
+        )
+
+    def test_column_custom_clause_element_expressions(self):
+        User, users = self.classes.User, self.tables.users
+
+        from sqlalchemy.orm.properties import ColumnProperty
+
+        class LowerFactory(ColumnProperty.Comparator):
+            def __clause_element__(self):
+                return func.lower(
+                    self._orm_annotate_column(self.prop.columns[0])
+                )
+
+        self.mapper(
+            User,
+            users,
+            properties={
+                "name": column_property(
+                    users.c.name, comparator_factory=LowerFactory
+                )
+            },
+        )
+        self.assert_compile(
+            User.name == "ed",
+            "lower(users.name) = :lower_1",
+            dialect=default.DefaultDialect(),
+        )
+        eq_([str(expr) for expr in User.name.expressions], ["users.name"])
+        eq_(
+            [str(expr) for expr in aliased(User, name="u1").name.expressions],
+            ["u1.name"],
+        )
+
     def test_synonym(self):
         users, User = self.tables.users, self.classes.User
 